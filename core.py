@@ -12,7 +12,7 @@ import time
 import hashlib
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Any, Set, Union
+from typing import Dict, FrozenSet, List, Optional, Any, Union
 from pathlib import Path
 
 # External dependencies
@@ -116,7 +116,8 @@ class Config:
 # DATA MODELS
 # =============================================================================
 
-@dataclass
+# Slotted: hundreds of articles are rebuilt for every deduplication pass
+@dataclass(slots=True)
 class Article:
     """Represents a news article."""
     title: str
@@ -192,11 +193,20 @@ class ContentSimilarity:
     
     # Performance optimization: Cache expensive fingerprint calculations
     _fingerprint_cache: Dict[str, str] = {}
+    # Word sets are rebuilt for every article pair during deduplication; cache them per text
+    _word_set_cache: Dict[str, FrozenSet[str]] = {}
+    
+    _STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+    
+    # Compiled once; normalize_text runs for every title and body compared
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _NON_WORD_RE = re.compile(r'[^\w\s]')
     
     @staticmethod
     def clear_cache():
-        """Clear fingerprint cache to free memory."""
+        """Clear fingerprint and word set caches to free memory."""
         ContentSimilarity._fingerprint_cache.clear()
+        ContentSimilarity._word_set_cache.clear()
     
     @staticmethod
     def normalize_text(text: str) -> str:
@@ -204,18 +214,28 @@ class ContentSimilarity:
         if not text:
             return ""
         # Remove extra whitespace, convert to lowercase, remove special characters
-        normalized = re.sub(r'\s+', ' ', text.lower().strip())
-        normalized = re.sub(r'[^\w\s]', '', normalized)
+        normalized = ContentSimilarity._WHITESPACE_RE.sub(' ', text.lower().strip())
+        normalized = ContentSimilarity._NON_WORD_RE.sub('', normalized)
         return normalized
     
     @staticmethod
-    def get_word_set(text: str) -> Set[str]:
+    def get_word_set(text: str) -> FrozenSet[str]:
         """Extract normalized word set from text."""
+        cached = ContentSimilarity._word_set_cache.get(text)
+        if cached is not None:
+            return cached
+        
         normalized = ContentSimilarity.normalize_text(text)
         words = normalized.split()
         # Filter out very short words and common stop words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        return {word for word in words if len(word) > 2 and word not in stop_words}
+        stop_words = ContentSimilarity._STOP_WORDS
+        result = frozenset(word for word in words if len(word) > 2 and word not in stop_words)
+        
+        # Cache result (limit sized for one run's titles and bodies)
+        if len(ContentSimilarity._word_set_cache) < 1000:
+            ContentSimilarity._word_set_cache[text] = result
+        
+        return result
     
     @staticmethod
     def title_similarity(title1: str, title2: str) -> float:
@@ -365,14 +385,15 @@ class Storage:
                 logger.info(f"File {filepath} does not exist, using defaults")
                 return default if default is not None else {}
             
-            if file_path.stat().st_size == 0:
+            # Parse the raw bytes directly; skips the text-decoding wrapper
+            raw = file_path.read_bytes()
+            if not raw:
                 logger.warning(f"File {filepath} is empty, using defaults")
                 return default if default is not None else {}
                 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.debug(f"Successfully loaded {filepath}")
-                return data
+            data = json.loads(raw)
+            logger.debug(f"Successfully loaded {filepath}")
+            return data
                 
         except Exception as e:
             logger.error(f"Error loading {filepath}: {e}")
@@ -453,6 +474,61 @@ class GeminiClient:
     ❌ NEVER USE: Complex types.Tool() objects (causes error tweets)
     """
     
+    # Leading bullet markers, quotes and spaces trimmed from summary lines in one pass;
+    # a plain lstrip() follows to also drop Unicode whitespace such as NBSP
+    _BULLET_LEAD_CHARS = '•-*"\' \t'
+    
+    # Meta-analysis openers stripped from headlines; one anchored alternation, compiled once
+    _HEADLINE_META_PHRASES = (
+        r'the article states that|the article discusses|according to the article|from the article|'
+        r'based on the article|the report states|this article discusses'
+    )
+    _HEADLINE_META_RE = re.compile(rf'^(?:{_HEADLINE_META_PHRASES})', re.IGNORECASE)
+    _HEADLINE_META_EXTRACT_RE = re.compile(rf'(?:{_HEADLINE_META_PHRASES})[\s:,]+(.*)', re.IGNORECASE)
+    
+    # Lowercase phrases Gemini uses when it could not read the article URL.
+    # Shorter prefixes cover their longer variants ("unable to fetch" covers "unable to fetch the content").
+    _URL_ACCESS_ERROR_PATTERNS = (
+        "unable to fetch",
+        "unable to access",
+        "could not retrieve the content",
+        "failed to fetch the content",
+        "cannot access the url",
+        "could not access",
+    )
+    
+    # Lowercase terms that mark a failed API call as a URL retrieval failure
+    _URL_RETRIEVAL_ERROR_TERMS = ('url', 'retrieve', 'fetch', 'access', 'blocked', 'forbidden', '403', '404')
+    
+    # Summary post-processing patterns, compiled once instead of per line
+    _BULLET_POINT_RE = re.compile(r'[•\-\*]\s+\w{3,}')
+    # Anchored skip patterns share one prefix regex so each line is matched once at its start
+    _SUMMARY_SKIP_PREFIX_RE = re.compile(
+        r'(?:i will|i am|let me|here are|here is'
+        r'|the article|from the article|based on|according to'
+        r'|the following|these are|below are'
+        r'|(?:bullet points?|summary|details?)[:.]'
+        r'|(?:this article|the piece|the report)\s+(?:discusses|states|mentions|covers))'
+    )
+    _SUMMARY_SKIP_RES = tuple(re.compile(pattern) for pattern in (
+        r'(extract|create|generate|provide|present)\s+(the|specific|details)',
+        r'(the article discusses|the article states|the article mentions|the article reports)',
+        r'(now let\'?s|now we|let\'?s identify|let\'?s look)',
+        r'(what not to repeat|what to avoid|what we should)',
+    ))
+    _FACT_RE = re.compile(r'[A-Z]{2,}|\d+|bitcoin|btc|mara|riot|hive|cleanpark', re.IGNORECASE)
+    _FALLBACK_FACT_RE = re.compile(r'\d+[%$]|\d+\s*(BTC|miners?|facility|percent|million|billion)', re.IGNORECASE)
+    # Lowercase phrases that expose Gemini's internal processing ("now i need" covers "now i need to")
+    _INTERNAL_PROCESSING_PHRASES = (
+        "okay, i have", "okay i have", "now i need", "let me find",
+        "forbidden info", "i'll extract", "i need to identify",
+    )
+    # Lowercase meta-commentary phrases rejected by the fallback fact extraction
+    _FALLBACK_META_PHRASES = (
+        'i will', 'let me', 'here are', 'from the article:', 'based on', 'according to',
+        'the article discusses', 'the article states', "now let's", 'what not to repeat',
+    )
+    
     def __init__(self, api_key: str):
         """Initialize Gemini client with API key."""
         if not api_key:
@@ -469,37 +545,26 @@ class GeminiClient:
     
     def _clean_headline(self, headline: str) -> str:
         """Clean up headline text by removing unwanted formatting and meta-language."""
-        import re
-        
         # Remove quotes if present
         headline = headline.strip('"\'')
         
-        # Remove markdown formatting
-        headline = re.sub(r'\*\*', '', headline)
-        headline = re.sub(r'__', '', headline)
+        # Remove markdown formatting (plain replaces; no regex needed for literal markers)
+        headline = headline.replace('**', '').replace('__', '')
         
         # Remove any leading/trailing whitespace
         headline = headline.strip()
         
         # CRITICAL: Remove meta-analysis language that sometimes appears
-        meta_patterns = [
-            r'^(the article states that|the article discusses|according to the article|from the article)',
-            r'^(based on the article|the report states|this article discusses)',
-        ]
-        
-        headline_lower = headline.lower()
-        for pattern in meta_patterns:
-            if re.search(pattern, headline_lower):
-                logger.warning(f"⚠️ Removing meta-language from headline: {headline}")
-                # Try to extract the actual content after the meta-phrase
-                match = re.search(r'(?:the article states that|the article discusses|according to the article|from the article|based on the article|the report states|this article discusses)[\s:,]+(.*)', headline, re.IGNORECASE)
-                if match:
-                    headline = match.group(1).strip()
-                    # Capitalize first letter if needed
-                    if headline and headline[0].islower():
-                        headline = headline[0].upper() + headline[1:]
-                    logger.info(f"✅ Cleaned headline: {headline}")
-                    break
+        if self._HEADLINE_META_RE.match(headline):
+            logger.warning(f"⚠️ Removing meta-language from headline: {headline}")
+            # Try to extract the actual content after the meta-phrase
+            match = self._HEADLINE_META_EXTRACT_RE.search(headline)
+            if match:
+                headline = match.group(1).strip()
+                # Capitalize first letter if needed
+                if headline and headline[0].islower():
+                    headline = headline[0].upper() + headline[1:]
+                logger.info(f"✅ Cleaned headline: {headline}")
         
         return headline
     
@@ -561,76 +626,47 @@ class GeminiClient:
     
     def _process_summary_response(self, summary_text: str) -> str:
         """Process and clean Gemini's summary response to extract only bullet points."""
-        import re
-        
         # CRITICAL: Detect and reject responses that are PRIMARILY internal processing
         # Check if response has ANY actual bullet points with content
-        has_bullet_points = bool(re.search(r'[•\-\*]\s+\w{3,}', summary_text))
+        has_bullet_points = bool(self._BULLET_POINT_RE.search(summary_text))
         
         # CRITICAL: Detect internal processing language ONLY if there are NO bullet points
         # This prevents exposing pure thought process as tweets while allowing mixed content
-        internal_processing_patterns = [
-            "okay, i have", "now i need to", "let me find",
-            "forbidden info", "i'll extract", "i need to identify",
-            "okay i have", "now i need"
-        ]
-        
-        # Only return fallback if internal processing AND no bullet points
-        text_lower = summary_text.lower()
-        has_internal_processing = any(pattern in text_lower for pattern in internal_processing_patterns)
-        
-        if has_internal_processing and not has_bullet_points:
-            logger.error(f"❌ CRITICAL: Gemini response is pure internal processing, no content")
-            # Return safe fallback instead of exposing metadata
-            return "• Bitcoin mining sector update\n• Industry development\n• See article for details"
-        
-        lines = summary_text.strip().split('\n')
+        # Only return fallback if internal processing AND no bullet points; skips lowercasing the common case
+        if not has_bullet_points:
+            text_lower = summary_text.lower()
+            if any(phrase in text_lower for phrase in self._INTERNAL_PROCESSING_PHRASES):
+                logger.error(f"❌ CRITICAL: Gemini response is pure internal processing, no content")
+                # Return safe fallback instead of exposing metadata
+                return "• Bitcoin mining sector update\n• Industry development\n• See article for details"
+        
+        # Strip every line once and drop empty ones; both passes below reuse this list
+        lines = [stripped for line in summary_text.splitlines() if (stripped := line.strip())]
         bullet_points = []
         
         # Filter lines to keep only actual bullet points
         for line in lines:
-            line = line.strip()
+            # Clean the line: remove bullet markers, extra dashes, quotes at start
+            clean_line = line.lstrip(self._BULLET_LEAD_CHARS).lstrip()
             
-            # Skip empty lines
-            if not line:
+            # Skip very short lines (less than 20 chars of actual content) before lowercasing
+            if len(clean_line) < 20:
                 continue
             
-            # Clean the line: remove bullet markers, extra dashes, quotes at start
-            clean_line = line.lstrip('•-* ').strip()
-            clean_line = clean_line.lstrip('-* ').strip()  # Remove any remaining dashes/asterisks
-            clean_line = clean_line.lstrip('"\'').strip()  # Remove quotes at start
-            
             line_lower = clean_line.lower()
             
             # Skip lines that look like Gemini's thinking process or meta-commentary
-            skip_patterns = [
-                r'^(i will|i am|let me|here are|here is)',
-                r'^(the article|from the article|based on|according to)',
-                r'^(the following|these are|below are)',
-                r'(extract|create|generate|provide|present)\s+(the|specific|details)',
-                r'^(bullet points?|summary|details?)[:.]',
-                r'(the article discusses|the article states|the article mentions|the article reports)',
-                r'(now let\'?s|now we|let\'?s identify|let\'?s look)',
-                r'(what not to repeat|what to avoid|what we should)',
-                r'^(this article|the piece|the report)\s+(discusses|states|mentions|covers)',
-            ]
-            
-            should_skip = False
-            for pattern in skip_patterns:
-                if re.search(pattern, line_lower):
-                    should_skip = True
-                    break
+            should_skip = (
+                self._SUMMARY_SKIP_PREFIX_RE.match(line_lower) is not None
+                or any(pattern.search(line_lower) for pattern in self._SUMMARY_SKIP_RES)
+            )
             
             if should_skip:
                 continue
             
-            # Additional check: skip very short lines (less than 20 chars of actual content)
-            if len(clean_line) < 20:
-                continue
-            
             # Only keep lines that look like actual facts (have numbers, company names, or specific data)
             # This helps filter out malformed partial content
-            if re.search(r'[A-Z]{2,}|\d+|bitcoin|btc|mara|riot|hive|cleanpark', clean_line, re.IGNORECASE):
+            if self._FACT_RE.search(clean_line):
                 bullet_points.append(f"• {clean_line}")
         
         # If we found valid bullet points, return them
@@ -641,24 +677,20 @@ class GeminiClient:
         # Fallback: try to extract any meaningful content that looks like facts
         meaningful_lines = []
         for line in lines:
-            line = line.strip()
-            line_lower = line.lower()
-            
             # Must be substantial content
             if len(line) < 20:
                 continue
             
+            line_lower = line.lower()
+            
             # Skip meta-commentary
-            if any(p in line_lower for p in [
-                'i will', 'let me', 'here are', 'from the article:', 'based on', 'according to',
-                'the article discusses', 'the article states', 'now let\'s', 'what not to repeat'
-            ]):
+            if any(p in line_lower for p in self._FALLBACK_META_PHRASES):
                 continue
             
             # Look for lines with numbers, percentages, or dollar amounts (likely real facts)
-            if re.search(r'\d+[%$]|\d+\s*(BTC|miners?|facility|percent|million|billion)', line, re.IGNORECASE):
+            if self._FALLBACK_FACT_RE.search(line):
                 # Clean this line too
-                clean = line.lstrip('•-* ').lstrip('-* ').lstrip('"\'').strip()
+                clean = line.lstrip(self._BULLET_LEAD_CHARS).lstrip()
                 meaningful_lines.append(f"• {clean}")
         
         if meaningful_lines:
@@ -727,22 +759,10 @@ class GeminiClient:
             headline = response.text.strip()
             
             # CRITICAL: Check for Gemini error messages indicating URL retrieval failure
-            error_patterns = [
-                "unable to fetch the content",
-                "unable to access the content",
-                "could not retrieve the content",
-                "failed to fetch the content",
-                "cannot access the URL",
-                "unable to fetch",
-                "unable to access",
-                "could not access"
-            ]
-            
             headline_lower = headline.lower()
-            for pattern in error_patterns:
-                if pattern in headline_lower:
-                    logger.warning(f"❌ Gemini returned URL access error: {headline[:100]}...")
-                    raise URLRetrievalError(f"Failed to retrieve content from {article.url}: Gemini access error")
+            if any(pattern in headline_lower for pattern in self._URL_ACCESS_ERROR_PATTERNS):
+                logger.warning(f"❌ Gemini returned URL access error: {headline[:100]}...")
+                raise URLRetrievalError(f"Failed to retrieve content from {article.url}: Gemini access error")
             
             logger.info(f"✅ Generated headline with URL context: '{headline}'")
             
@@ -791,7 +811,7 @@ class GeminiClient:
         except Exception as e:
             # Check if this is a URL retrieval failure (not an API failure)
             error_message = str(e).lower()
-            if any(term in error_message for term in ['url', 'retrieve', 'fetch', 'access', 'blocked', 'forbidden', '403', '404']):
+            if any(term in error_message for term in self._URL_RETRIEVAL_ERROR_TERMS):
                 logger.warning(f"❌ URL retrieval failed for {article.url}: {e}")
                 # Try fallback with body if enabled
                 if use_body_fallback and article.body:
@@ -868,22 +888,10 @@ class GeminiClient:
             summary_text = response.text.strip()
             
             # CRITICAL: Check for Gemini error messages indicating URL retrieval failure
-            error_patterns = [
-                "unable to fetch the content",
-                "unable to access the content", 
-                "could not retrieve the content",
-                "failed to fetch the content",
-                "cannot access the URL",
-                "unable to fetch",
-                "unable to access",
-                "could not access"
-            ]
-            
             summary_lower = summary_text.lower()
-            for pattern in error_patterns:
-                if pattern in summary_lower:
-                    logger.warning(f"❌ Gemini returned URL access error: {summary_text[:100]}...")
-                    raise URLRetrievalError(f"Failed to retrieve content from {article.url}: Gemini access error")
+            if any(pattern in summary_lower for pattern in self._URL_ACCESS_ERROR_PATTERNS):
+                logger.warning(f"❌ Gemini returned URL access error: {summary_text[:100]}...")
+                raise URLRetrievalError(f"Failed to retrieve content from {article.url}: Gemini access error")
             
             logger.info(f"✅ Generated summary with URL context: '{summary_text}'")
             
@@ -932,7 +940,7 @@ class GeminiClient:
         except Exception as e:
             # Check if this is a URL retrieval failure (not an API failure)
             error_message = str(e).lower()
-            if any(term in error_message for term in ['url', 'retrieve', 'fetch', 'access', 'blocked', 'forbidden', '403', '404']):
+            if any(term in error_message for term in self._URL_RETRIEVAL_ERROR_TERMS):
                 logger.warning(f"❌ URL retrieval failed for {article.url} during summary generation: {e}")
                 raise URLRetrievalError(f"Failed to retrieve content from {article.url}: {e}")
             
@@ -1015,6 +1023,14 @@ class GeminiClient:
 class TextProcessor:
     """Text processing for tweet creation with Gemini AI integration."""
     
+    # Title prefixes stripped in one anchored pass, in the order they were previously removed one by one
+    # ("breaking:" twice because both the upper- and title-case variants were applied)
+    _TITLE_PREFIX_RE = re.compile(
+        r"^(?:breaking:\s*){0,2}(?:just in:\s*)?(?:news:\s*)?(?:bitcoin:\s*)?(?:btc:\s*)?",
+        re.IGNORECASE
+    )
+    _WHITESPACE_RE = re.compile(r'\s+')
+    
     @staticmethod
     def create_tweet_thread(article: Article, gemini_client: Optional[GeminiClient] = None) -> Optional[List[str]]:
         """Create a complete tweet thread with catchy headline, summary, and URL.
@@ -1041,13 +1057,15 @@ class TextProcessor:
             logger.info("🎯 Using Gemini-powered thread generation...")
             # Generate headline with body fallback enabled
             headline = gemini_client.generate_catchy_headline(article, use_body_fallback=True)
-            # Generate summary with body fallback enabled, passing the headline to avoid duplication
-            summary_text = gemini_client.generate_thread_summary(article, headline=headline, use_body_fallback=True)
             
+            # Bail out before the summary request: without a headline the thread is discarded anyway
             if not headline:
                 logger.error("❌ Failed to generate headline with Gemini - will retry later")
                 return None
             
+            # Generate summary with body fallback enabled, passing the headline to avoid duplication
+            summary_text = gemini_client.generate_thread_summary(article, headline=headline, use_body_fallback=True)
+            
             if not summary_text:
                 logger.error("❌ Failed to generate summary with Gemini - will retry later")
                 return None
@@ -1096,15 +1114,8 @@ class TextProcessor:
     @staticmethod
     def _clean_title(title: str) -> str:
         """Clean and optimize title for Twitter."""
-        prefixes_to_remove = [
-            r"^BREAKING:\s*", r"^Breaking:\s*", r"^JUST IN:\s*",
-            r"^News:\s*", r"^Bitcoin:\s*", r"^BTC:\s*"
-        ]
-        
-        for prefix in prefixes_to_remove:
-            title = re.sub(prefix, "", title, flags=re.IGNORECASE)
-        
-        title = re.sub(r'\s+', ' ', title).strip()
+        title = TextProcessor._TITLE_PREFIX_RE.sub("", title, count=1)
+        title = TextProcessor._WHITESPACE_RE.sub(' ', title).strip()
         return title
 
 
@@ -1198,6 +1209,117 @@ class NewsAPI:
     🔗 Quick Reference: /docs/api/quick-reference.md
     """
     
+    # Comprehensive list of publicly traded Bitcoin mining companies with tickers
+    # Note: Removed overly generic tickers like "ANY" (Sphere 3D) that cause false positives
+    _PUBLIC_MINERS = (
+        # Major US-listed Bitcoin miners
+        "marathon digital", "mara", "riot platforms", "riot", "cleanspark", "clsk",
+        "hut 8", "hut8", "core scientific", "corz", "cipher mining", "cifr",
+        "bitfarms", "bitf", "hive digital", "hive", "terawulf", "wulf",
+        "bitdeer", "btdr", "iris energy", "iren", "bit digital", "btbt",
+        "greenidge", "gree", "stronghold", "sdig", "argo blockchain", "arbk",
+        "arbkf", "canaan", "can", "bit mining", "btcm", "bitfufu", "fufu",
+        # International and emerging miners
+        "phoenix group", "phx", "the9 limited", "ncty", "dmg blockchain", "dmgi",
+        "dmggf", "cathedra bitcoin", "cbit", "cbttf", "bitcoin well", "btcw",
+        "lm funding", "lmfa", "sos limited", "sos", "neptune digital", "nda",
+        "npptf", "digihost", "hsshf", "sato technologies", "sato",
+        "sphere 3d",  # Sphere 3D mining company (ticker omitted due to false positives)
+        "gryphon digital", "gryp", "american bitcoin", "abtc",
+        "abits group", "abts"
+    )
+    
+    # Keyword lists used by _is_bitcoin_relevant(), built once rather than per article
+    _PROMOTIONAL_TERMS = (
+        "cloud mining", "free bitcoin mining", "claim", "bonus", "gift", 
+        "sign up", "register now", "join now", "get started", "download app",
+        "earn daily", "passive income", "$118", "hashj", "momhash", 
+        "free mining", "no investment", "guaranteed returns", "daily earnings"
+    )
+    _ENVIRONMENTAL_BLAME_TERMS = (
+        "emissions crisis", "fuel emissions", "pollution", "pollut", 
+        "heat pollution", "noise pollution", "environmental damage",
+        "environmental crisis", "climate crisis", "boiling the oceans",
+        "boil the ocean", "ecological damage", "ecological crisis",
+        "carbon footprint", "greenhouse gas", "global warming contributor",
+        "energy waste", "wasting energy", "environmental disaster",
+        "environmental harm", "environmental impact crisis", 
+        "destroying the environment", "killing the planet",
+        "climate change cause", "accelerating climate change"
+    )
+    _NEGATIVE_FRAMING_INDICATORS = (
+        "thousands of miners fuel", "miners fuel", "mining fuels",
+        "farms generate", "mining generates", "miners generate",
+        "mining causes", "miners cause", "responsible for",
+        "blamed for", "contributes to crisis", "worsening",
+        "devastating", "harmful", "damaging"
+    )
+    _OTHER_CRYPTOS = (
+        "ethereum", "eth", "ether",  # CRITICAL: Added "ether" to prevent Ethereum posts
+        "solana", "sol", "cardano", "ada",
+        "dogecoin", "doge", "litecoin", "ltc",
+        "ripple", "xrp", "polkadot", "dot",
+        "chainlink", "link", "polygon", "matic",
+        "avalanche", "avax", "cosmos", "atom",
+        "near", "algorand", "algo", "tezos",
+        "monero", "xmr", "zcash", "zec"
+    )
+    _BITCOIN_MINING_TERMS = ("bitcoin", "btc", "mining", "miner", "hash rate", "asic")
+    _BITCOIN_TERMS = ("bitcoin", "btc")
+    _MINING_TERMS = ("mining", "miner", "miners", "mine", "mined")
+    _NON_MINING_TITLES = (
+        "defi", "nft", "metaverse", "web3", "stablecoin", "usdt", "tether"
+    )
+    _EXCLUDED_TOPICS = (
+        "stablecoin minting", "stable coin issuance", "defi protocol",
+        "nft marketplace", "web3 gaming", "metaverse platform"
+    )
+    _GENERIC_TERMS = (
+        "what is bitcoin mining", "how to mine bitcoin", 
+        "bitcoin mining explained", "mining tutorial",
+        "beginner's guide", "introduction to mining"
+    )
+    _SUSPICIOUS_TERMS = (
+        "guaranteed profit", "risk-free", "100% profit",
+        "get rich", "make money fast", "instant profit",
+        "ponzi", "pyramid", "scam"
+    )
+    _LAW_ENFORCEMENT_TERMS = (
+        "seiz", "arrest", "indict", "criminal", "fraud", "money laundering",
+        "department of justice", "doj", "treasury", "sec charges", "law enforcement",
+        "investigation", "convicted", "sentenced", "prison", "jail",
+        "confiscate", "forfeiture", "ransomware", "cyberattack", "hack",
+        "transnational criminal", "organized crime", "trafficking", "scam compound"
+    )
+    _CORE_MINING_TERMS = (
+        "mining company", "mining operation", "mining facility", 
+        "mining farm", "mining pool", "hash rate", "hashrate", "difficulty",
+        "mining equipment", "mining revenue", "mining profit",
+        "block reward", "halving", "mining stocks", "public miner",
+        "mining rig", "mining power", "mining capacity", "mining contract",
+        "mining data center", "mining infrastructure", "asic miner",
+        "mining performance", "mining efficiency", "mining expansion",
+        # ADDED: AI and data center terms (AI + mining is relevant)
+        "ai data center", "artificial intelligence", "data center", "power struggle",
+        "electricity", "energy consumption", "power grid", "renewable energy",
+        # ADDED: Political/regulatory terms (political mining news is relevant)  
+        "regulation", "regulatory", "government", "policy", "ban", "approval",
+        "law", "legal", "compliance", "taxation", "lobbying", "political"
+    )
+    # AI/data-center and political terms that auto-approve; every entry is also in _CORE_MINING_TERMS
+    _AI_POLITICAL_TERMS = frozenset({
+        "ai data center", "artificial intelligence", "power struggle", "electricity",
+        "regulation", "regulatory", "government", "policy", "political"
+    })
+    _HARDWARE_ONLY_INDICATORS = (
+        "manufacturer", "manufacturing", "supply chain", "equipment maker",
+        "hardware company", "chip maker", "asic manufacturer"
+    )
+    _MINING_OPERATIONS_TERMS = (
+        "mining company", "mining operation", "mining facility", "mining farm",
+        "hash rate", "mining revenue", "mining profit", "mining expansion"
+    )
+    
     def __init__(self, config: Config):
         self.config = config
         self._client = None
@@ -1261,50 +1383,34 @@ class NewsAPI:
         
         # CRITICAL: Check for promotional content FIRST
         # This prevents scam apps like "HashJ" from being approved
-        promotional_terms = [
-            "cloud mining", "free bitcoin mining", "claim", "bonus", "gift", 
-            "sign up", "register now", "join now", "get started", "download app",
-            "earn daily", "passive income", "$118", "hashj", "momhash", 
-            "free mining", "no investment", "guaranteed returns", "daily earnings"
-        ]
-        if any(term in text for term in promotional_terms):
+        if any(term in text for term in self._PROMOTIONAL_TERMS):
             logger.info(f"❌ Excluded promotional content: {article.title}")
             return False
         
+        # CRITICAL: Check for altcoins in title BEFORE checking public miners
+        # This prevents approving articles like "Bit Digital Pivots to Ether"
+        # Reject if other crypto mentioned in title (clear indicator of primary topic)
+        # Runs ahead of the environmental scans: it only reads the short title, and either check rejects
+        for crypto in self._OTHER_CRYPTOS:
+            if crypto in title_lower:
+                logger.info(f"❌ Article title mentions non-Bitcoin cryptocurrency '{crypto}': {article.title}")
+                return False
+        
         # CRITICAL: Check for environmental blame BEFORE public miners check
         # Exclude articles that blame Bitcoin mining for environmental problems
         # These articles frame mining negatively for pollution, emissions, climate impact, etc.
-        environmental_blame_terms = [
-            "emissions crisis", "fuel emissions", "pollution", "pollut", 
-            "heat pollution", "noise pollution", "environmental damage",
-            "environmental crisis", "climate crisis", "boiling the oceans",
-            "boil the ocean", "ecological damage", "ecological crisis",
-            "carbon footprint", "greenhouse gas", "global warming contributor",
-            "energy waste", "wasting energy", "environmental disaster",
-            "environmental harm", "environmental impact crisis", 
-            "destroying the environment", "killing the planet",
-            "climate change cause", "accelerating climate change"
-        ]
-        
-        # Check for negative framing with environmental terms
-        # Look for combinations that indicate blame rather than neutral reporting
-        negative_framing_indicators = [
-            "thousands of miners fuel", "miners fuel", "mining fuels",
-            "farms generate", "mining generates", "miners generate",
-            "mining causes", "miners cause", "responsible for",
-            "blamed for", "contributes to crisis", "worsening",
-            "devastating", "harmful", "damaging"
-        ]
-        
-        environmental_blame_count = sum(1 for term in environmental_blame_terms if term in text)
-        negative_framing_count = sum(1 for term in negative_framing_indicators if term in text)
+        environmental_blame_count = sum(1 for term in self._ENVIRONMENTAL_BLAME_TERMS if term in text)
         
         # Reject if article has both environmental blame language AND negative framing
         # This filters out articles that blame mining for environmental problems
         # while allowing neutral reporting on energy use, renewables, etc.
-        if environmental_blame_count >= 1 and negative_framing_count >= 1:
-            logger.info(f"❌ Excluded environmental blame article: {article.title} (Environmental terms: {environmental_blame_count}, Negative framing: {negative_framing_count})")
-            return False
+        # Negative framing only matters once an environmental term is present, so skip that scan otherwise
+        if environmental_blame_count >= 1:
+            # Look for combinations that indicate blame rather than neutral reporting
+            negative_framing_count = sum(1 for term in self._NEGATIVE_FRAMING_INDICATORS if term in text)
+            if negative_framing_count >= 1:
+                logger.info(f"❌ Excluded environmental blame article: {article.title} (Environmental terms: {environmental_blame_count}, Negative framing: {negative_framing_count})")
+                return False
         
         # Also reject if there are multiple strong environmental blame terms (2+)
         # indicating the article is primarily about environmental criticism
@@ -1312,73 +1418,27 @@ class NewsAPI:
             logger.info(f"❌ Excluded environmental criticism article: {article.title} (Environmental blame terms: {environmental_blame_count})")
             return False
         
-        # CRITICAL: Check for altcoins in title BEFORE checking public miners
-        # This prevents approving articles like "Bit Digital Pivots to Ether"
-        other_cryptos = [
-            "ethereum", "eth", "ether",  # CRITICAL: Added "ether" to prevent Ethereum posts
-            "solana", "sol", "cardano", "ada",
-            "dogecoin", "doge", "litecoin", "ltc",
-            "ripple", "xrp", "polkadot", "dot",
-            "chainlink", "link", "polygon", "matic",
-            "avalanche", "avax", "cosmos", "atom",
-            "near", "algorand", "algo", "tezos",
-            "monero", "xmr", "zcash", "zec"
-        ]
-        
-        # Reject if other crypto mentioned in title (clear indicator of primary topic)
-        for crypto in other_cryptos:
-            if crypto in title_lower:
-                logger.info(f"❌ Article title mentions non-Bitcoin cryptocurrency '{crypto}': {article.title}")
-                return False
-        
         # ENHANCED: Check for public Bitcoin mining companies (ALWAYS relevant if not environmental blame or altcoin)
-        # Comprehensive list of publicly traded Bitcoin mining companies with tickers
-        # Note: Removed overly generic tickers like "ANY" (Sphere 3D) that cause false positives
-        public_miners = [
-            # Major US-listed Bitcoin miners
-            "marathon digital", "mara", "riot platforms", "riot", "cleanspark", "clsk",
-            "hut 8", "hut8", "core scientific", "corz", "cipher mining", "cifr",
-            "bitfarms", "bitf", "hive digital", "hive", "terawulf", "wulf",
-            "bitdeer", "btdr", "iris energy", "iren", "bit digital", "btbt",
-            "greenidge", "gree", "stronghold", "sdig", "argo blockchain", "arbk",
-            "arbkf", "canaan", "can", "bit mining", "btcm", "bitfufu", "fufu",
-            # International and emerging miners
-            "phoenix group", "phx", "the9 limited", "ncty", "dmg blockchain", "dmgi",
-            "dmggf", "cathedra bitcoin", "cbit", "cbttf", "bitcoin well", "btcw",
-            "lm funding", "lmfa", "sos limited", "sos", "neptune digital", "nda",
-            "npptf", "digihost", "hsshf", "sato technologies", "sato",
-            "sphere 3d",  # Sphere 3D mining company (ticker omitted due to false positives)
-            "gryphon digital", "gryp", "american bitcoin", "abtc",
-            "abits group", "abts"
-        ]
-        
-        if any(company in text for company in public_miners):
+        if any(company in text for company in self._PUBLIC_MINERS):
             logger.info(f"✅ Public mining company detected - auto-approved: {article.title}")
             return True
         
         # Must contain Bitcoin mining terms
-        bitcoin_terms = ["bitcoin", "btc", "mining", "miner", "hash rate", "asic"]
-        if not any(term in text for term in bitcoin_terms):
+        if not any(term in text for term in self._BITCOIN_MINING_TERMS):
             return False
         
         # CORRECTED: Require Bitcoin AND mining in meaningful context (more flexible)
-        bitcoin_terms_list = ["bitcoin", "btc"]
-        mining_terms_list = ["mining", "miner", "miners", "mine", "mined"]
-        
-        bitcoin_mentions = sum(1 for term in bitcoin_terms_list if term in text)
-        mining_mentions = sum(1 for term in mining_terms_list if term in text)
+        bitcoin_mentions = sum(1 for term in self._BITCOIN_TERMS if term in text)
+        mining_mentions = sum(1 for term in self._MINING_TERMS if term in text)
         
         if bitcoin_mentions == 0 or mining_mentions == 0:
             logger.info(f"❌ Missing Bitcoin+mining combination: {article.title} (Bitcoin: {bitcoin_mentions}, Mining: {mining_mentions})")
             return False
         
         # CORRECTED: More restrictive non-mining titles (only clear exclusions)
-        non_mining_titles = [
-            "defi", "nft", "metaverse", "web3", "stablecoin", "usdt", "tether"
-        ]
         # NOTE: Removed "gold", "treasury", "investment fund", "trading", "exchange", "tokenized" 
         # as these can be part of legitimate mining news (e.g., "France opposes takeover")
-        if any(term in title_lower for term in non_mining_titles):
+        if any(term in title_lower for term in self._NON_MINING_TITLES):
             logger.info(f"❌ Excluded non-mining title topic: {article.title}")
             return False
         
@@ -1387,17 +1447,7 @@ class NewsAPI:
         
         # Count altcoin mentions in body text for articles that passed title check
         # Re-use the same crypto list defined earlier
-        other_cryptos_list = [
-            "ethereum", "eth", "ether",
-            "solana", "sol", "cardano", "ada",
-            "dogecoin", "doge", "litecoin", "ltc",
-            "ripple", "xrp", "polkadot", "dot",
-            "chainlink", "link", "polygon", "matic",
-            "avalanche", "avax", "cosmos", "atom",
-            "near", "algorand", "algo", "tezos",
-            "monero", "xmr", "zcash", "zec"
-        ]
-        other_mentions = sum(1 for crypto in other_cryptos_list if crypto in text)
+        other_mentions = sum(1 for crypto in self._OTHER_CRYPTOS if crypto in text)
         
         # Reject if other cryptos mentioned significantly (3+ times) - indicates primary focus
         if other_mentions >= 3:
@@ -1410,13 +1460,9 @@ class NewsAPI:
             return False
         
         # CORRECTED: More specific crypto-adjacent exclusions (removed overly broad terms)
-        excluded_topics = [
-            "stablecoin minting", "stable coin issuance", "defi protocol",
-            "nft marketplace", "web3 gaming", "metaverse platform"
-        ]
         # NOTE: Removed broad terms like "digital asset", "investment vehicle", "treasury"
         # as these can appear in legitimate mining regulatory/political news
-        if any(term in text for term in excluded_topics):
+        if any(term in text for term in self._EXCLUDED_TOPICS):
             logger.info(f"❌ Excluded crypto-adjacent non-mining topic: {article.title}")
             return False
         
@@ -1424,35 +1470,18 @@ class NewsAPI:
         # This check is moved earlier to prevent scam apps from being approved
         
         # Exclude generic educational content  
-        generic_terms = [
-            "what is bitcoin mining", "how to mine bitcoin", 
-            "bitcoin mining explained", "mining tutorial",
-            "beginner's guide", "introduction to mining"
-        ]
-        if any(term in title_lower for term in generic_terms):
+        if any(term in title_lower for term in self._GENERIC_TERMS):
             logger.info(f"❌ Excluded generic educational content: {article.title}")
             return False
         
         # Exclude suspicious/scam indicators
-        suspicious_terms = [
-            "guaranteed profit", "risk-free", "100% profit",
-            "get rich", "make money fast", "instant profit",
-            "ponzi", "pyramid", "scam"
-        ]
-        if any(term in text for term in suspicious_terms):
+        if any(term in text for term in self._SUSPICIOUS_TERMS):
             logger.info(f"❌ Excluded suspicious content: {article.title}")
             return False
         
         # CRITICAL: Exclude law enforcement/criminal/seizure articles (not about mining operations)
         # These articles mention "mining" only tangentially in criminal context
-        law_enforcement_terms = [
-            "seiz", "arrest", "indict", "criminal", "fraud", "money laundering",
-            "department of justice", "doj", "treasury", "sec charges", "law enforcement",
-            "investigation", "convicted", "sentenced", "prison", "jail",
-            "confiscate", "forfeiture", "ransomware", "cyberattack", "hack",
-            "transnational criminal", "organized crime", "trafficking", "scam compound"
-        ]
-        law_enforcement_mentions = sum(1 for term in law_enforcement_terms if term in text)
+        law_enforcement_mentions = sum(1 for term in self._LAW_ENFORCEMENT_TERMS if term in text)
         
         # If article heavily focuses on law enforcement (3+ mentions), it's not about mining operations
         if law_enforcement_mentions >= 3:
@@ -1460,34 +1489,14 @@ class NewsAPI:
             return False
         
         # CORRECTED: Expanded mining focus terms including AI/political/regulatory
-        core_mining_terms = [
-            "mining company", "mining operation", "mining facility", 
-            "mining farm", "mining pool", "hash rate", "hashrate", "difficulty",
-            "mining equipment", "mining revenue", "mining profit",
-            "block reward", "halving", "mining stocks", "public miner",
-            "mining rig", "mining power", "mining capacity", "mining contract",
-            "mining data center", "mining infrastructure", "asic miner",
-            "mining performance", "mining efficiency", "mining expansion",
-            # ADDED: AI and data center terms (AI + mining is relevant)
-            "ai data center", "artificial intelligence", "data center", "power struggle",
-            "electricity", "energy consumption", "power grid", "renewable energy",
-            # ADDED: Political/regulatory terms (political mining news is relevant)  
-            "regulation", "regulatory", "government", "policy", "ban", "approval",
-            "law", "legal", "compliance", "taxation", "lobbying", "political"
-        ]
-        
         # CORRECTED: More flexible mining focus (1 substantial term can be enough)
-        mining_mentions = sum(1 for term in core_mining_terms if term in text)
+        matched_mining_terms = [term for term in self._CORE_MINING_TERMS if term in text]
+        mining_mentions = len(matched_mining_terms)
         
         # Special case: If it's about AI + mining, data centers, or political/regulatory, 
-        # it's automatically relevant even with fewer traditional mining terms
-        ai_mining_terms = ["ai data center", "artificial intelligence", "power struggle", "electricity"]
-        political_terms = ["regulation", "regulatory", "government", "policy", "political"]
-        
-        has_ai_mining = any(term in text for term in ai_mining_terms)
-        has_political = any(term in text for term in political_terms)
-        
-        if has_ai_mining or has_political:
+        # it's automatically relevant even with fewer traditional mining terms.
+        # Those terms are all core mining terms, so reuse the matches instead of rescanning the text.
+        if any(term in self._AI_POLITICAL_TERMS for term in matched_mining_terms):
             logger.info(f"✅ Bitcoin mining content approved (AI/political relevance): {article.title}")
             return True
         
@@ -1498,18 +1507,10 @@ class NewsAPI:
         
         # CORRECTED: Less restrictive hardware manufacturing check
         # Only exclude if it's ONLY about hardware manufacturing with no mining operations
-        hardware_only_indicators = [
-            "manufacturer", "manufacturing", "supply chain", "equipment maker",
-            "hardware company", "chip maker", "asic manufacturer"
-        ]
-        hardware_mentions = sum(1 for term in hardware_only_indicators if term in text)
+        hardware_mentions = sum(1 for term in self._HARDWARE_ONLY_INDICATORS if term in text)
         
         # Only exclude if it's primarily hardware manufacturing AND has no operational mining content
-        mining_operations_terms = [
-            "mining company", "mining operation", "mining facility", "mining farm",
-            "hash rate", "mining revenue", "mining profit", "mining expansion"
-        ]
-        operations_mentions = sum(1 for term in mining_operations_terms if term in text)
+        operations_mentions = sum(1 for term in self._MINING_OPERATIONS_TERMS if term in text)
         
         # If it's primarily hardware manufacturing AND has no operations content
         if hardware_mentions >= 2 and operations_mentions == 0:
@@ -1529,6 +1530,25 @@ class BitcoinMiningBot:
     Simplified Bitcoin Mining News Bot.
     """
     
+    # CRITICAL: Patterns that should NEVER appear in tweets (checked against lowercased content)
+    _FORBIDDEN_CONTENT_PATTERNS = (
+        # Gemini internal processing
+        "okay, i have", "now i need", "let me", "i'll",
+        "forbidden info", "i need to", "i will now",
+        "let's identify", "here are", "based on the article",
+        "okay i have", "now i need to",
+        
+        # Meta-language
+        "the article states", "according to the article",
+        "the report says", "from the article",
+        
+        # Altcoin mentions that shouldn't be in Bitcoin bot
+        "ether", "ethereum", "solana", "cardano",
+        
+        # Debug/error messages
+        "error:", "warning:", "failed to", "unable to"
+    )
+    
     def __init__(self, config: Optional[Config] = None, safe_mode: bool = False):
         """Initialize the bot with configuration."""
         self.config = config or Config.from_env()
@@ -1628,13 +1648,16 @@ class BitcoinMiningBot:
             # Convert existing queued articles to Article objects for comparison
             existing_articles: List[Article] = []
             
-            # Add already queued articles for comparison
+            # Add already queued articles for comparison, collecting their URLs in the same pass
+            queued_urls = set()
             for qa_data in queued_articles_data:
                 try:
-                    existing_articles.append(Article.from_dict(qa_data))
+                    queued_article = Article.from_dict(qa_data)
                 except (ValueError, KeyError) as e:
                     logger.warning(f"Invalid queued article data: {e}")
                     continue
+                existing_articles.append(queued_article)
+                queued_urls.add(queued_article.url)
             
             # ENHANCED: Also load posted articles history for deduplication
             posted_history = self.posted_data.get("posted_articles_history", [])
@@ -1657,7 +1680,6 @@ class BitcoinMiningBot:
             
             # Note: We can't reconstruct Article objects from just URLs in posted_uris,
             # so for backwards compatibility, we still check URL duplicates first
-            queued_urls = set(qa.get("url", "") for qa in queued_articles_data)
             existing_urls = posted_urls.union(queued_urls)
             
             for article in articles:
@@ -1830,28 +1852,8 @@ class BitcoinMiningBot:
         
         CRITICAL: This prevents exposing Gemini's internal thought process as tweets.
         """
-        
-        # CRITICAL: Patterns that should NEVER appear in tweets
-        forbidden_patterns = [
-            # Gemini internal processing
-            "okay, i have", "now i need", "let me", "i'll",
-            "forbidden info", "i need to", "i will now",
-            "let's identify", "here are", "based on the article",
-            "okay i have", "now i need to",
-            
-            # Meta-language
-            "the article states", "according to the article",
-            "the report says", "from the article",
-            
-            # Altcoin mentions that shouldn't be in Bitcoin bot
-            "ether", "ethereum", "solana", "cardano",
-            
-            # Debug/error messages
-            "error:", "warning:", "failed to", "unable to"
-        ]
-        
         content_lower = content.lower()
-        for pattern in forbidden_patterns:
+        for pattern in self._FORBIDDEN_CONTENT_PATTERNS:
             if pattern in content_lower:
                 logger.error(f"❌ Content validation failed - contains: '{pattern}'")
                 return False
@@ -9,6 +9,79 @@ Test script to demonstrate the critical fixes for:
 import sys
 from core import BitcoinMiningBot, Config, Article, NewsAPI, GeminiClient
 
+# Relevance cases for the ether/ethereum title filter
+ETHER_TEST_ARTICLES = (
+    {
+        "title": "Bit Digital Pivots, Amasses $500M Ether Post-Mining Exit",
+        "body": "Company transitions to Ethereum staking operations",
+        "url": "https://example.com/ether1",
+        "expected": False,
+        "reason": "Contains 'ether' in title"
+    },
+    {
+        "title": "Ethereum Mining Shifts to Proof of Stake",
+        "body": "Ethereum network completes merge",
+        "url": "https://example.com/ethereum1",
+        "expected": False,
+        "reason": "Contains 'ethereum' in title"
+    },
+    {
+        "title": "Bitcoin Mining Operations Expand",
+        "body": "Marathon Digital expands bitcoin mining operations",
+        "url": "https://example.com/bitcoin1",
+        "expected": True,
+        "reason": "Valid Bitcoin mining article"
+    }
+)
+
+# Summary responses and the text each cleaned result must keep
+GEMINI_METADATA_CASES = (
+    {
+        "input": "Okay, I have the article content. Now I need to find three facts...",
+        "should_contain": "Bitcoin mining sector update",
+        "reason": "Pure internal processing should return fallback"
+    },
+    {
+        "input": "• Marathon Digital expands operations\n• Revenue increased 42%\n• Hash rate improved",
+        "should_contain": "Marathon Digital",
+        "reason": "Valid bullet points should be preserved"
+    },
+    {
+        "input": "Now let's identify what not to repeat.\n• Q3 revenue increased 50% year-over-year\n• New facility opened in Texas this month\n• Hash rate doubled to 5 EH/s",
+        "should_contain": "Q3 revenue increased",
+        "reason": "Mixed content should preserve bullet points"
+    }
+)
+
+# Tweet content and whether pre-posting validation should accept it
+CONTENT_VALIDATION_CASES = (
+    {
+        "content": "Okay, I have analyzed the article",
+        "should_pass": False,
+        "reason": "Contains internal processing language"
+    },
+    {
+        "content": "The article states that Marathon Digital is expanding",
+        "should_pass": False,
+        "reason": "Contains meta-language"
+    },
+    {
+        "content": "Ethereum mining operations are growing",
+        "should_pass": False,
+        "reason": "Contains altcoin mention"
+    },
+    {
+        "content": "Marathon Digital Expands Mining Operations",
+        "should_pass": True,
+        "reason": "Valid Bitcoin mining content"
+    },
+    {
+        "content": "BREAKING: CleanSpark Reports Record Revenue",
+        "should_pass": True,
+        "reason": "Valid headline format"
+    }
+)
+
 def test_ether_articles():
     """Test that ether/ethereum articles are properly filtered."""
     print("\n🧪 Testing Ether/Ethereum Filtering")
@@ -17,35 +90,10 @@ def test_ether_articles():
     config = Config()
     news_api = NewsAPI(config)
     
-    # Test case 1: Article with "ether" in title
-    test_articles = [
-        {
-            "title": "Bit Digital Pivots, Amasses $500M Ether Post-Mining Exit",
-            "body": "Company transitions to Ethereum staking operations",
-            "url": "https://example.com/ether1",
-            "expected": False,
-            "reason": "Contains 'ether' in title"
-        },
-        {
-            "title": "Ethereum Mining Shifts to Proof of Stake",
-            "body": "Ethereum network completes merge",
-            "url": "https://example.com/ethereum1",
-            "expected": False,
-            "reason": "Contains 'ethereum' in title"
-        },
-        {
-            "title": "Bitcoin Mining Operations Expand",
-            "body": "Marathon Digital expands bitcoin mining operations",
-            "url": "https://example.com/bitcoin1",
-            "expected": True,
-            "reason": "Valid Bitcoin mining article"
-        }
-    ]
-    
     passed = 0
     failed = 0
     
-    for test_case in test_articles:
+    for test_case in ETHER_TEST_ARTICLES:
         article_data = {
             "title": test_case["title"],
             "body": test_case["body"],
@@ -67,7 +115,7 @@ def test_ether_articles():
             print(f"   Reason: {test_case['reason']}")
             failed += 1
     
-    print(f"\nResults: {passed}/{len(test_articles)} passed")
+    print(f"\nResults: {passed}/{len(ETHER_TEST_ARTICLES)} passed")
     return failed == 0
 
 def test_gemini_metadata():
@@ -77,28 +125,10 @@ def test_gemini_metadata():
     
     gemini = GeminiClient()
     
-    test_cases = [
-        {
-            "input": "Okay, I have the article content. Now I need to find three facts...",
-            "should_contain": "Bitcoin mining sector update",
-            "reason": "Pure internal processing should return fallback"
-        },
-        {
-            "input": "• Marathon Digital expands operations\n• Revenue increased 42%\n• Hash rate improved",
-            "should_contain": "Marathon Digital",
-            "reason": "Valid bullet points should be preserved"
-        },
-        {
-            "input": "Now let's identify what not to repeat.\n• Q3 revenue increased 50% year-over-year\n• New facility opened in Texas this month\n• Hash rate doubled to 5 EH/s",
-            "should_contain": "Q3 revenue increased",
-            "reason": "Mixed content should preserve bullet points"
-        }
-    ]
-    
     passed = 0
     failed = 0
     
-    for test_case in test_cases:
+    for test_case in GEMINI_METADATA_CASES:
         result = gemini._process_summary_response(test_case["input"])
         
         if test_case["should_contain"] in result:
@@ -110,7 +140,7 @@ def test_gemini_metadata():
             print(f"   Got: {result[:100]}...")
             failed += 1
     
-    print(f"\nResults: {passed}/{len(test_cases)} passed")
+    print(f"\nResults: {passed}/{len(GEMINI_METADATA_CASES)} passed")
     return failed == 0
 
 def test_content_validation():
@@ -121,38 +151,10 @@ def test_content_validation():
     config = Config()
     bot = BitcoinMiningBot(config=config)
     
-    test_cases = [
-        {
-            "content": "Okay, I have analyzed the article",
-            "should_pass": False,
-            "reason": "Contains internal processing language"
-        },
-        {
-            "content": "The article states that Marathon Digital is expanding",
-            "should_pass": False,
-            "reason": "Contains meta-language"
-        },
-        {
-            "content": "Ethereum mining operations are growing",
-            "should_pass": False,
-            "reason": "Contains altcoin mention"
-        },
-        {
-            "content": "Marathon Digital Expands Mining Operations",
-            "should_pass": True,
-            "reason": "Valid Bitcoin mining content"
-        },
-        {
-            "content": "BREAKING: CleanSpark Reports Record Revenue",
-            "should_pass": True,
-            "reason": "Valid headline format"
-        }
-    ]
-    
     passed = 0
     failed = 0
     
-    for test_case in test_cases:
+    for test_case in CONTENT_VALIDATION_CASES:
         result = bot._validate_content_before_posting(test_case["content"])
         
         if result == test_case["should_pass"]:
@@ -165,7 +167,7 @@ def test_content_validation():
             print(f"   Content: {test_case['content'][:60]}...")
             failed += 1
     
-    print(f"\nResults: {passed}/{len(test_cases)} passed")
+    print(f"\nResults: {passed}/{len(CONTENT_VALIDATION_CASES)} passed")
     return failed == 0
 
 def main():
@@ -6,6 +6,61 @@ Shows how meta-analysis language is detected and removed from AI responses.
 
 from core import GeminiClient
 
+# (dirty headline, expected clean headline) pairs
+HEADLINE_CASES = (
+    (
+        "The article states that Marathon Digital Expands Operations",
+        "Marathon Digital Expands Operations"
+    ),
+    (
+        "According to the article, RIOT Platforms Reports Record Revenue",
+        "RIOT Platforms Reports Record Revenue"
+    ),
+    (
+        "From the article: CleanSpark Hits 52-Week High",
+        "CleanSpark Hits 52-Week High"
+    ),
+    (
+        "The report states that Bitcoin Mining Difficulty Increases",
+        "Bitcoin Mining Difficulty Increases"
+    ),
+    (
+        "Clean Headline Without Meta-Language",
+        "Clean Headline Without Meta-Language"
+    ),
+)
+
+# Gemini summaries with the phrases each cleaned result must drop and keep
+SUMMARY_CASES = (
+    {
+        "name": "Summary with meta-commentary",
+        "input": """Now let's identify what not to repeat from the headline.
+• Revenue increased 42% year-over-year
+• The article discusses expansion plans
+• Hash rate improved significantly""",
+        "should_remove": ["now let's", "the article discusses"],
+        "should_keep": ["Revenue increased", "Hash rate improved"]
+    },
+    {
+        "name": "Summary with 'I will' statements",
+        "input": """I will create three bullet points.
+• Q3 mining revenue up 35%
+• Let me explain the details
+• Power costs decreased to 4.2¢/kWh""",
+        "should_remove": ["i will", "let me"],
+        "should_keep": ["Q3 mining", "Power costs"]
+    },
+    {
+        "name": "Clean summary without meta-language",
+        "input": """• Added 2,500 miners at Texas facility
+• Q2 2024 operational start
+• 8-month ROI target""",
+        "should_remove": [],
+        "should_keep": ["Added 2,500 miners", "Q2 2024", "ROI target"]
+    },
+)
+
+
 def test_headline_cleaning():
     """Demonstrate headline meta-language removal."""
     print("=" * 80)
@@ -15,33 +70,10 @@ def test_headline_cleaning():
     # Create a mock GeminiClient instance just for the cleaning method
     gemini = object.__new__(GeminiClient)
     
-    test_cases = [
-        (
-            "The article states that Marathon Digital Expands Operations",
-            "Marathon Digital Expands Operations"
-        ),
-        (
-            "According to the article, RIOT Platforms Reports Record Revenue",
-            "RIOT Platforms Reports Record Revenue"
-        ),
-        (
-            "From the article: CleanSpark Hits 52-Week High",
-            "CleanSpark Hits 52-Week High"
-        ),
-        (
-            "The report states that Bitcoin Mining Difficulty Increases",
-            "Bitcoin Mining Difficulty Increases"
-        ),
-        (
-            "Clean Headline Without Meta-Language",
-            "Clean Headline Without Meta-Language"
-        ),
-    ]
-    
     print("\n📰 HEADLINE CLEANING TESTS")
     print("=" * 80)
     
-    for dirty, expected_clean in test_cases:
+    for dirty, expected_clean in HEADLINE_CASES:
         result = gemini._clean_headline(dirty)
         status = "✅ PASS" if result == expected_clean or "the article" not in result.lower() else "❌ FAIL"
         
@@ -59,36 +91,7 @@ def test_summary_cleaning():
     
     gemini = object.__new__(GeminiClient)
     
-    test_summaries = [
-        {
-            "name": "Summary with meta-commentary",
-            "input": """Now let's identify what not to repeat from the headline.
-• Revenue increased 42% year-over-year
-• The article discusses expansion plans
-• Hash rate improved significantly""",
-            "should_remove": ["now let's", "the article discusses"],
-            "should_keep": ["Revenue increased", "Hash rate improved"]
-        },
-        {
-            "name": "Summary with 'I will' statements",
-            "input": """I will create three bullet points.
-• Q3 mining revenue up 35%
-• Let me explain the details
-• Power costs decreased to 4.2¢/kWh""",
-            "should_remove": ["i will", "let me"],
-            "should_keep": ["Q3 mining", "Power costs"]
-        },
-        {
-            "name": "Clean summary without meta-language",
-            "input": """• Added 2,500 miners at Texas facility
-• Q2 2024 operational start
-• 8-month ROI target""",
-            "should_remove": [],
-            "should_keep": ["Added 2,500 miners", "Q2 2024", "ROI target"]
-        },
-    ]
-    
-    for test in test_summaries:
+    for test in SUMMARY_CASES:
         print(f"\n🔍 Test: {test['name']}")
         print("-" * 80)
         print(f"Input:\n{test['input']}")
@@ -8,6 +8,7 @@ import sys
 import os
 import json
 import tempfile
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
@@ -22,6 +23,15 @@ except ImportError as e:
     sys.exit(1)
 
 
+@contextmanager
+def temp_state_file(state):
+    """Yield the path of a throwaway posted-articles file seeded with state."""
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as temp_dir:
+        path = Path(temp_dir) / "posted_articles.json"
+        path.write_text(json.dumps(state), encoding="utf-8")
+        yield str(path)
+
+
 class TestFetchAndDeduplication:
     """Tests for improved fetch logic and deduplication."""
 
@@ -85,17 +95,15 @@ class TestFetchAndDeduplication:
     def test_bot_uses_last_run_time_for_fetch(self):
         """Test that bot uses last_run_time from storage when fetching articles."""
         # Create temporary file for testing
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_file = f.name
-            last_run = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
-            json.dump({
-                "posted_uris": ["http://example.com/old"],
-                "queued_articles": [],
-                "posted_articles_history": [],
-                "last_run_time": last_run
-            }, f)
+        last_run = (datetime.now(timezone.utc) - timedelta(hours=2)).isoformat()
+        state = {
+            "posted_uris": ["http://example.com/old"],
+            "queued_articles": [],
+            "posted_articles_history": [],
+            "last_run_time": last_run
+        }
         
-        try:
+        with temp_state_file(state) as temp_file:
             config = Config()
             config.posted_articles_file = temp_file
             config.twitter_api_key = "test"
@@ -130,34 +138,27 @@ class TestFetchAndDeduplication:
                     assert time_diff < 1  # Should be exact
             
             print("  ✅ test_bot_uses_last_run_time_for_fetch")
-            
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
 
     def test_deduplication_against_posted_history(self):
         """Test that new articles are checked against posted_articles_history for duplicates."""
         # Create temporary file with posted history
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_file = f.name
-            json.dump({
-                "posted_uris": ["http://example.com/article1"],
-                "queued_articles": [],
-                "posted_articles_history": [
-                    {
-                        "url": "http://example.com/article1",
-                        "title": "Marathon Digital Holdings Expands Bitcoin Mining Operations in Texas",
-                        "source": "Test Source",
-                        "date_published": "2024-01-01T12:00:00Z",
-                        "date_posted": "2024-01-01T13:00:00Z",
-                        "body_preview": "Marathon Digital Holdings announced a major expansion of its Bitcoin mining operations in West Texas. The company will deploy 10,000 new ASIC miners at its facility in Garden City, increasing its total hashrate capacity by 50%. The expansion is expected to be completed by Q4 2024."
-                    }
-                ],
-                "last_run_time": datetime.now(timezone.utc).isoformat()
-            }, f)
+        state = {
+            "posted_uris": ["http://example.com/article1"],
+            "queued_articles": [],
+            "posted_articles_history": [
+                {
+                    "url": "http://example.com/article1",
+                    "title": "Marathon Digital Holdings Expands Bitcoin Mining Operations in Texas",
+                    "source": "Test Source",
+                    "date_published": "2024-01-01T12:00:00Z",
+                    "date_posted": "2024-01-01T13:00:00Z",
+                    "body_preview": "Marathon Digital Holdings announced a major expansion of its Bitcoin mining operations in West Texas. The company will deploy 10,000 new ASIC miners at its facility in Garden City, increasing its total hashrate capacity by 50%. The expansion is expected to be completed by Q4 2024."
+                }
+            ],
+            "last_run_time": datetime.now(timezone.utc).isoformat()
+        }
         
-        try:
+        with temp_state_file(state) as temp_file:
             config = Config()
             config.posted_articles_file = temp_file
             config.twitter_api_key = "test"
@@ -194,33 +195,26 @@ class TestFetchAndDeduplication:
                             assert not mock_post.called, "Similar article should have been filtered as duplicate"
             
             print("  ✅ test_deduplication_against_posted_history")
-            
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
 
     def test_deduplication_against_queued_articles(self):
         """Test that deduplication still works against queued articles."""
         # Create temporary file with queued article
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_file = f.name
-            json.dump({
-                "posted_uris": [],
-                "queued_articles": [
-                    {
-                        "title": "CleanSpark Reports Record Bitcoin Mining Revenue in Q3",
-                        "body": "CleanSpark Inc announced record Bitcoin mining revenue for the third quarter. The company mined 1,800 Bitcoin during the quarter, a 40% increase from Q2. CleanSpark's hashrate now exceeds 16 EH/s following recent expansions.",
-                        "url": "http://example.com/queued",
-                        "source": {"title": "Test Source"},
-                        "dateTimePub": "2024-01-01T12:00:00Z"
-                    }
-                ],
-                "posted_articles_history": [],
-                "last_run_time": datetime.now(timezone.utc).isoformat()
-            }, f)
+        state = {
+            "posted_uris": [],
+            "queued_articles": [
+                {
+                    "title": "CleanSpark Reports Record Bitcoin Mining Revenue in Q3",
+                    "body": "CleanSpark Inc announced record Bitcoin mining revenue for the third quarter. The company mined 1,800 Bitcoin during the quarter, a 40% increase from Q2. CleanSpark's hashrate now exceeds 16 EH/s following recent expansions.",
+                    "url": "http://example.com/queued",
+                    "source": {"title": "Test Source"},
+                    "dateTimePub": "2024-01-01T12:00:00Z"
+                }
+            ],
+            "posted_articles_history": [],
+            "last_run_time": datetime.now(timezone.utc).isoformat()
+        }
         
-        try:
+        with temp_state_file(state) as temp_file:
             config = Config()
             config.posted_articles_file = temp_file
             config.twitter_api_key = "test"
@@ -265,34 +259,27 @@ class TestFetchAndDeduplication:
                             assert final_queue_length == 0, f"Queue should be empty but has {final_queue_length} articles"
             
             print("  ✅ test_deduplication_against_queued_articles")
-            
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
 
     def test_url_deduplication_still_works(self):
         """Test that URL-based deduplication still works (exact URL match)."""
         # Create temporary file with posted URL
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_file = f.name
-            json.dump({
-                "posted_uris": ["http://example.com/exact-match"],
-                "queued_articles": [],
-                "posted_articles_history": [
-                    {
-                        "url": "http://example.com/exact-match",
-                        "title": "Original Article",
-                        "source": "Test Source",
-                        "date_published": "2024-01-01T12:00:00Z",
-                        "date_posted": "2024-01-01T13:00:00Z",
-                        "body_preview": "Some content"
-                    }
-                ],
-                "last_run_time": datetime.now(timezone.utc).isoformat()
-            }, f)
+        state = {
+            "posted_uris": ["http://example.com/exact-match"],
+            "queued_articles": [],
+            "posted_articles_history": [
+                {
+                    "url": "http://example.com/exact-match",
+                    "title": "Original Article",
+                    "source": "Test Source",
+                    "date_published": "2024-01-01T12:00:00Z",
+                    "date_posted": "2024-01-01T13:00:00Z",
+                    "body_preview": "Some content"
+                }
+            ],
+            "last_run_time": datetime.now(timezone.utc).isoformat()
+        }
         
-        try:
+        with temp_state_file(state) as temp_file:
             config = Config()
             config.posted_articles_file = temp_file
             config.twitter_api_key = "test"
@@ -326,34 +313,27 @@ class TestFetchAndDeduplication:
                             assert not mock_post.called, "Article with duplicate URL should be filtered"
             
             print("  ✅ test_url_deduplication_still_works")
-            
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
 
     def test_new_unique_article_not_filtered(self):
         """Test that genuinely new articles are not filtered out."""
         # Create temporary file with different article
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_file = f.name
-            json.dump({
-                "posted_uris": ["http://example.com/old-article"],
-                "queued_articles": [],
-                "posted_articles_history": [
-                    {
-                        "url": "http://example.com/old-article",
-                        "title": "Old News About Mining Difficulty",
-                        "source": "Test Source",
-                        "date_published": "2024-01-01T12:00:00Z",
-                        "date_posted": "2024-01-01T13:00:00Z",
-                        "body_preview": "Bitcoin mining difficulty reached a new all-time high this week..."
-                    }
-                ],
-                "last_run_time": datetime.now(timezone.utc).isoformat()
-            }, f)
+        state = {
+            "posted_uris": ["http://example.com/old-article"],
+            "queued_articles": [],
+            "posted_articles_history": [
+                {
+                    "url": "http://example.com/old-article",
+                    "title": "Old News About Mining Difficulty",
+                    "source": "Test Source",
+                    "date_published": "2024-01-01T12:00:00Z",
+                    "date_posted": "2024-01-01T13:00:00Z",
+                    "body_preview": "Bitcoin mining difficulty reached a new all-time high this week..."
+                }
+            ],
+            "last_run_time": datetime.now(timezone.utc).isoformat()
+        }
         
-        try:
+        with temp_state_file(state) as temp_file:
             config = Config()
             config.posted_articles_file = temp_file
             config.twitter_api_key = "test"
@@ -391,11 +371,6 @@ class TestFetchAndDeduplication:
                                 assert mock_post.called, "New unique article should not be filtered"
             
             print("  ✅ test_new_unique_article_not_filtered")
-            
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
 
 
 def run_tests():
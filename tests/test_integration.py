@@ -6,7 +6,6 @@ Focuses on end-to-end workflows and system integration testing.
 
 import sys
 import os
-import json
 import tempfile
 from unittest.mock import patch
 from pathlib import Path
@@ -21,6 +20,9 @@ except ImportError as e:
     print(f"❌ Failed to import modules: {e}")
     sys.exit(1)
 
+# Empty bot state, pre-serialized so fixtures are written without json.dump
+EMPTY_STATE_JSON = b'{"posted_uris": [], "queued_articles": [], "last_run_time": null}'
+
 
 class TestIntegrationWorkflows:
     """Streamlined integration tests for complete workflows."""
@@ -54,12 +56,8 @@ class TestIntegrationWorkflows:
             }
         ]
 
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            json.dump({
-                "posted_uris": [],
-                "queued_articles": [],
-                "last_run_time": None
-            }, f)
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.json') as f:
+            f.write(EMPTY_STATE_JSON)
             config.posted_articles_file = f.name
 
         try:
@@ -145,8 +143,8 @@ class TestIntegrationWorkflows:
             [{"title": "Valid Article", "url": "https://example.com", "body": "Content", "source": {"title": "Test"}}],
         ]
 
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            json.dump({"posted_uris": [], "queued_articles": [], "last_run_time": None}, f)
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.json') as f:
+            f.write(EMPTY_STATE_JSON)
             config.posted_articles_file = f.name
 
         try:
@@ -215,7 +215,7 @@ class BotTools:
                 print("\n📭 No articles currently queued")
                 return True
             
-            print(f"\n📋 Queued Articles:")
+            lines = [f"\n📋 Queued Articles:"]
             for i, article in enumerate(queue):
                 title = article.get("title", "Unknown Title")
                 source_data = article.get("source", {})
@@ -225,9 +225,10 @@ class BotTools:
                 else:
                     source = str(source_data) if source_data else "Unknown"
                 
-                print(f"\n{i+1}. {title[:70]}{'...' if len(title) > 70 else ''}")
-                print(f"   Source: {source}")
+                lines.append(f"\n{i+1}. {title[:70]}{'...' if len(title) > 70 else ''}")
+                lines.append(f"   Source: {source}")
             
+            print("\n".join(lines))
             return True
                 
         except Exception as e:
@@ -423,38 +424,41 @@ class BotTools:
                 return
             
             # Show most recent articles first
-            recent_articles = list(reversed(posted_history))[-limit:]
-            recent_articles.reverse()  # Most recent first
+            recent_articles = posted_history[-limit:][::-1]
             
+            # Collect the listing and print it in one call rather than per field
+            lines = []
             for i, article in enumerate(recent_articles, 1):
-                print(f"\n📝 #{i} - Posted Article")
-                print(f"Title: {article.get('title', 'Unknown')}")
-                print(f"Source: {article.get('source', 'Unknown')}")
-                print(f"URL: {article.get('url', 'Unknown')}")
+                lines.append(f"\n📝 #{i} - Posted Article")
+                lines.append(f"Title: {article.get('title', 'Unknown')}")
+                lines.append(f"Source: {article.get('source', 'Unknown')}")
+                lines.append(f"URL: {article.get('url', 'Unknown')}")
                 
                 # Format dates nicely
                 date_posted = article.get('date_posted')
                 if date_posted:
                     try:
                         posted_dt = datetime.fromisoformat(date_posted.replace('Z', '+00:00'))
-                        print(f"Posted: {posted_dt.strftime('%Y-%m-%d %H:%M UTC')}")
+                        lines.append(f"Posted: {posted_dt.strftime('%Y-%m-%d %H:%M UTC')}")
                     except:
-                        print(f"Posted: {date_posted}")
+                        lines.append(f"Posted: {date_posted}")
                 
                 date_published = article.get('date_published')
                 if date_published:
                     try:
                         pub_dt = datetime.fromisoformat(date_published.replace('Z', '+00:00'))
-                        print(f"Published: {pub_dt.strftime('%Y-%m-%d %H:%M UTC')}")
+                        lines.append(f"Published: {pub_dt.strftime('%Y-%m-%d %H:%M UTC')}")
                     except:
-                        print(f"Published: {date_published}")
+                        lines.append(f"Published: {date_published}")
                 
                 # Show preview of article content
                 preview = article.get('body_preview', '')
                 if preview:
-                    print(f"Preview: {preview}")
+                    lines.append(f"Preview: {preview}")
                 
-                print("-" * 40)
+                lines.append("-" * 40)
+            
+            print("\n".join(lines))
             
             print(f"\n📊 Total articles in history: {len(posted_history)}")
             print(f"📊 Total URLs tracked: {len(posted_data.get('posted_uris', []))}")